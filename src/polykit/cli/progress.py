@@ -6,8 +6,6 @@ from contextlib import contextmanager
 from functools import wraps
 from typing import TYPE_CHECKING, Any, TypeVar
 
-from halo import Halo
-
 from polykit.text import color as colorize
 from polykit.text import print_color
 
@@ -15,6 +13,8 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Generator
     from pathlib import Path
 
+    from halo import Halo
+
     from polykit.text.types import TextColor
 
 T = TypeVar("T")
@@ -36,19 +36,23 @@ def with_spinner(
     def spinner_decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
+            from halo import Halo
+
             spinner_text = colorize(text, color) if color else text
             spinner = Halo(text=spinner_text, spinner="dots", color=color)
             spinner.start()
             try:
                 result = func(*args, **kwargs)
-                if success:
-                    spinner.succeed(colorize(success, color))
-                else:
-                    spinner.stop()
             except Exception as e:
                 spinner.fail(colorize(f"Failed: {e}", "red"))
                 raise
-            finally:
+            except BaseException:  # Still clear the spinner on interrupts
+                spinner.stop()
+                raise
+
+            if success:
+                spinner.succeed(colorize(success, color))
+            else:
                 spinner.stop()
             return result
 
@@ -99,6 +103,8 @@ def halo_progress(
         fail_message = f"{fail_message} {item}"
 
     if show:
+        from halo import Halo
+
         spinner = Halo(text=colorize(start_message, text_color), spinner="dots")
         spinner.start()
     else:
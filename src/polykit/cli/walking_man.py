@@ -52,6 +52,9 @@ class WalkingMan:
         self.animation_thread: Thread | None = None
         self._stop_event: Event = Event()
 
+        # Rendered frames by character and position, since the same frames repeat every lap
+        self._frames: dict[tuple[str, int], str] = {}
+
     def __enter__(self):
         """Start Walking Man when entering the context manager."""
         self.start()
@@ -77,12 +80,16 @@ class WalkingMan:
         self.animation_thread.daemon = True
         self.animation_thread.start()
 
-    @handle_interrupt()
     def stop(self) -> None:
-        """Stop the Walking Man animation."""
+        """Stop the Walking Man animation.
+
+        Setting the stop event wakes the animation thread right away, so the join only has to wait
+        out a frame that's being written. It's bounded by the frame interval in case the thread is
+        stuck on a slow terminal, and since the thread is a daemon it will finish on its own.
+        """
+        self._stop_event.set()
         if self.animation_thread and self.animation_thread.is_alive():
-            self._stop_event.set()
-            self.animation_thread.join()
+            self.animation_thread.join(timeout=self.speed + 0.05)
 
     @handle_interrupt()
     def _show_animation(self) -> None:  # noqa: C901, PLR0912, PLR0915
@@ -110,10 +117,7 @@ class WalkingMan:
         while not self._stop_event.is_set():  # noqa: PLR1702
             # If waving, show the wave animation
             if is_waving:
-                wave_frames = [
-                    self.CHARACTER_MIDDLE,
-                    self.CHARACTER_WAVE,
-                ]
+                wave_frames = (self.CHARACTER_MIDDLE, self.CHARACTER_WAVE)
                 display_char = wave_frames[wave_frame % len(wave_frames)]
                 self._print_frame(display_char, position)
 
@@ -180,11 +184,13 @@ class WalkingMan:
                         if completed_rotations % 2 == 0:
                             completed_rotations += 1  # Show middle position
 
-    @handle_interrupt()
     def _print_frame(self, character: str, position: int) -> None:
         """Print a single frame of the Walking Man animation."""
-        colored_character = colorize(character, self.color) if self.color else character
-        print(" " * position + colored_character, end="\r")
+        frame = self._frames.get((character, position))
+        if frame is None:
+            colored_character = colorize(character, self.color) if self.color else character
+            frame = self._frames[character, position] = f"{' ' * position}{colored_character}\r"
+        sys.stdout.write(frame)
 
         # Use the customizable speed for the animation
         self._stop_event.wait(self.speed)
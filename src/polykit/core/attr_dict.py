@@ -3,10 +3,15 @@ from __future__ import annotations
 from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from typing import Any
 
+# Value types that never need converting, checked before the slower Mapping check
+_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool, bytes, type(None)})
+
 
 class AttrDict(MutableMapping[str, Any]):
     """A dictionary that allows for attribute-style access with nested merging."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, *args: Mapping[str, Any] | Iterable[tuple[str, Any]], **kwargs: Any):
         self._data: dict[str, Any] = {}
         self.update(dict[str, Any](*args, **kwargs))
@@ -37,11 +42,13 @@ class AttrDict(MutableMapping[str, Any]):
         return False
 
     def __getattr__(self, name: str) -> Any:
-        try:
-            return self[name]
-        except KeyError as e:
-            msg = f"'AttrDict' object has no attribute '{name}'"
-            raise AttributeError(msg) from e
+        # _data only ends up here if it hasn't been set yet, such as while copying or unpickling
+        if name != "_data":
+            data = self._data
+            if name in data:
+                return data[name]
+        msg = f"'AttrDict' object has no attribute '{name}'"
+        raise AttributeError(msg)
 
     def __setattr__(self, name: str, value: Any) -> None:
         if name == "_data":
@@ -63,7 +70,9 @@ class AttrDict(MutableMapping[str, Any]):
         for key, value in other_dict.items():
             current = result._data.get(key)
             if isinstance(current, AttrDict) and isinstance(value, (dict, AttrDict)):
-                result._data[key] = current | AttrDict(value)
+                result._data[key] = current | (
+                    value if isinstance(value, AttrDict) else AttrDict(value)
+                )
             else:
                 result._data[key] = self._convert(value)
 
@@ -73,8 +82,17 @@ class AttrDict(MutableMapping[str, Any]):
         """Implement reverse | operator for AttrDict with nested merging."""
         return self.copy() if other is None else AttrDict(other) | self
 
+    @classmethod
+    def _from_trusted(cls, data: dict[str, Any]) -> AttrDict:
+        """Create an AttrDict from data whose values have already been converted."""
+        obj: AttrDict = cls.__new__(cls)
+        obj._data = data.copy()
+        return obj
+
     @classmethod
     def _convert(cls, value: Any) -> Any:
+        if type(value) in _SCALAR_TYPES:
+            return value
         if isinstance(value, Mapping) and not isinstance(value, AttrDict):
             return cls(value)
         if isinstance(value, list):
@@ -83,19 +101,11 @@ class AttrDict(MutableMapping[str, Any]):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert AttrDict to a regular dictionary recursively."""
-
-        def _to_dict(value: Any) -> Any:
-            if isinstance(value, AttrDict):
-                return value.to_dict()
-            if isinstance(value, list):
-                return [_to_dict(v) for v in value]
-            return value
-
-        return {k: _to_dict(v) for k, v in self._data.items()}
+        return {k: _to_plain(v) for k, v in self._data.items()}
 
     def copy(self) -> AttrDict:
         """Return a shallow copy of the AttrDict."""
-        return AttrDict(self._data)
+        return self._from_trusted(self._data)
 
     def deep_copy(self) -> AttrDict:
         """Return a deep copy of the AttrDict."""
@@ -105,3 +115,14 @@ class AttrDict(MutableMapping[str, Any]):
 
     def __contains__(self, key: object) -> bool:
         return key in self._data
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert a value stored in an AttrDict back to plain dicts and lists."""
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, AttrDict):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    return value
@@ -5,8 +5,6 @@ import time
 from functools import wraps
 from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
-from halo import Halo
-
 if TYPE_CHECKING:
     import logging
     from collections.abc import Callable, Coroutine
@@ -29,6 +27,8 @@ def with_retries[T](operation_func: Callable[..., T]) -> Callable[..., T]:
         for attempt in range(retries):
             try:
                 if spinner:
+                    from halo import Halo
+
                     with Halo(spinner, color="blue"):
                         return operation_func(*args, **kwargs)
                 else:
@@ -104,9 +104,15 @@ def _log_and_warn(
     short_name = Path(filename).name if filename else "unknown"
     location = f"{short_name}:{line_num} in {function}" if filename and line_num else ""
 
-    # Create a logger and log the warning
-    from polykit.log import PolyLog
-
-    logger = PolyLog.get_logger(simple=True)
+    # Log the warning
+    logger = _get_logger()
     log_level = logging.WARNING if warn_type is DeprecationWarning else logging.ERROR
     logger.log(log_level, "%s (%s)", message, location)
+
+
+@functools.cache
+def _get_logger() -> logging.Logger:
+    """Get the logger for deprecation warnings, creating it on first use."""
+    from polykit.log import PolyLog
+
+    return PolyLog.get_logger("deprecate", simple=True)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from threading import Lock
 from typing import Any, ClassVar, TypeVar
+from weakref import WeakKeyDictionary
 
 T = TypeVar("T")
 
@@ -11,11 +12,11 @@ class Singleton(type):
 
     A metaclass that ensures classes have only one instance throughout the program's lifetime.
     Implements thread-safe instance creation using class-level locks, preventing race conditions
-    during instantiation. Instance tracking is handled through private class variables.
+    during instantiation.
 
-    This implementation uses a class-level dictionary to track instances by class and maintains
-    separate locks for each class to ensure thread safety. The first instantiation creates and
-    stores the instance, and subsequent instantiations return the stored instance.
+    Each instance is stored on its own class, and a separate lock is kept for each class to ensure
+    thread safety. The first instantiation creates and stores the instance, and subsequent
+    instantiations return the stored instance.
 
     # Basic usage is as simple as this:
 
@@ -34,16 +35,27 @@ class Singleton(type):
                     self._initialized = True
     """
 
-    __instances: ClassVar[dict[type, Any]] = {}
-    __locks: ClassVar[dict[type, Lock]] = {}
+    # The instance is stored on its own class rather than in a registry here, so a class that's no
+    # longer used can be garbage collected along with its instance
+    __instance_attr: ClassVar[str] = "_singleton_instance"
+    __locks: ClassVar[WeakKeyDictionary[type, Lock]] = WeakKeyDictionary()
+    __locks_guard: ClassVar[Lock] = Lock()
 
     def __call__(cls: type[T], *args: Any, **kwargs: Any) -> T:
         """Create a new instance of the class if one does not already exist."""
-        if cls not in Singleton.__locks:
-            Singleton.__locks[cls] = Lock()
-
-        with Singleton.__locks[cls]:
-            if cls not in Singleton.__instances:
+        # Once the instance exists, return it without taking any locks. This checks the class's own
+        # namespace so that subclasses don't pick up their parent's instance.
+        instance = cls.__dict__.get(Singleton.__instance_attr)
+        if instance is not None:
+            return instance
+
+        # Guard the lock map so two threads can't each create a lock for the same class
+        with Singleton.__locks_guard:
+            lock = Singleton.__locks.setdefault(cls, Lock())
+
+        with lock:
+            instance = cls.__dict__.get(Singleton.__instance_attr)
+            if instance is None:
                 instance = super().__call__(*args, **kwargs)  # type: ignore[misc]
-                Singleton.__instances[cls] = instance
-            return Singleton.__instances[cls]
+                setattr(cls, Singleton.__instance_attr, instance)
+            return instance
@@ -22,8 +22,11 @@ from __future__ import annotations
 
 import os
 import threading
-from datetime import UTC, datetime
-from typing import ClassVar, NamedTuple
+import time
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 class DecodedULID(NamedTuple):
@@ -33,6 +36,28 @@ class DecodedULID(NamedTuple):
     random_bytes: bytes
 
 
+# Masks for a full 128-bit ULID value and its 80-bit random component
+_ULID_MASK = (1 << 128) - 1
+_RANDOM_MASK = (1 << 80) - 1
+
+
+def _build_decode_table(alphabet: str) -> list[int]:
+    """Build the Crockford Base32 decode table, indexed by character code."""
+    table = [-1] * 256
+
+    # Standard alphabet
+    for i, c in enumerate(alphabet):
+        table[ord(c)] = i
+        table[ord(c.lower())] = i
+
+    # Crockford ambiguous character handling
+    table[ord("i")] = table[ord("I")] = 1
+    table[ord("l")] = table[ord("L")] = 1
+    table[ord("o")] = table[ord("O")] = 0
+
+    return table
+
+
 class ULID:
     """ULID generation and encoding/decoding utilities.
 
@@ -43,27 +68,11 @@ class ULID:
     LENGTH = 26
     ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
 
-    # Build decode table for fast lookup
-    _DECODE_TABLE: ClassVar[dict[int, int]] = {}
-
-    @classmethod
-    def _init_decode_table(cls) -> None:
-        """Initialize the decode table for Crockford Base32."""
-        if cls._DECODE_TABLE:
-            return
-
-        # Standard alphabet
-        for i, c in enumerate(cls.ALPHABET):
-            cls._DECODE_TABLE[ord(c)] = i
-            cls._DECODE_TABLE[ord(c.lower())] = i
+    # Bit offsets of each base32 digit in the 130-bit value, most significant first
+    _SHIFTS: ClassVar[tuple[int, ...]] = tuple(range(125, -5, -5))
 
-        # Crockford ambiguous character handling
-        cls._DECODE_TABLE[ord("i")] = 1
-        cls._DECODE_TABLE[ord("I")] = 1
-        cls._DECODE_TABLE[ord("l")] = 1
-        cls._DECODE_TABLE[ord("L")] = 1
-        cls._DECODE_TABLE[ord("o")] = 0
-        cls._DECODE_TABLE[ord("O")] = 0
+    # Decode table indexed by character code, with -1 for invalid characters
+    _DECODE_TABLE: ClassVar[list[int]] = _build_decode_table(ALPHABET)
 
     @classmethod
     def generate(cls, date: datetime | None = None) -> str:
@@ -80,9 +89,10 @@ class ULID:
             A 26-character ULID string.
         """
         if date is None:
-            date = datetime.now(UTC)
+            timestamp_ms = time.time_ns() // 1_000_000
+        else:
+            timestamp_ms = int(max(0, date.timestamp()) * 1000)
 
-        timestamp_ms = int(max(0, date.timestamp()) * 1000)
         random_bytes = os.urandom(10)
 
         return cls.encode(timestamp_ms, random_bytes)
@@ -97,36 +107,25 @@ class ULID:
         Returns:
             A tuple of (timestamp_ms, random_bytes) or None if invalid.
         """
-        if len(ulid) != cls.LENGTH:
-            return None
-
-        cls._init_decode_table()
-
-        # Parse base32 digits into 130-bit value (17 bytes, big-endian)
-        acc = bytearray(17)
-
-        try:
-            for c in ulid:
-                value = cls._DECODE_TABLE.get(ord(c))
-                if value is None:
-                    return None
-                cls._shift_left(acc, 5)
-                acc[-1] |= value
-        except (KeyError, IndexError):
+        if len(ulid) != cls.LENGTH or not ulid.isascii():
             return None
 
-        # ULID spec prefixes two leading 0 bits, so highest byte should be 0
-        if acc[0] != 0:
+        # Parse base32 digits into a 130-bit integer
+        table = cls._DECODE_TABLE
+        acc = 0
+        for c in ulid:
+            value = table[ord(c)]
+            if value < 0:
+                return None
+            acc = (acc << 5) | value
+
+        # ULID spec prefixes two leading 0 bits, so anything above 128 bits is invalid
+        if acc >> 128:
             return None
 
-        # Extract timestamp (6 bytes) and random (10 bytes)
-        bytes_data = bytes(acc[1:17])
-
-        timestamp_ms = 0
-        for i in range(6):
-            timestamp_ms = (timestamp_ms << 8) | bytes_data[i]
-
-        random_bytes = bytes_data[6:16]
+        # Extract timestamp (48 bits) and random (80 bits)
+        timestamp_ms = acc >> 80
+        random_bytes = (acc & _RANDOM_MASK).to_bytes(10, "big")
 
         return DecodedULID(timestamp_ms, random_bytes)
 
@@ -148,61 +147,27 @@ class ULID:
             msg = f"ULID random component must be 10 bytes, got {len(random_bytes)}"
             raise ValueError(msg)
 
-        # Build 16-byte array (6 bytes timestamp + 10 bytes random)
-        bytes_data = bytearray(16)
-
-        # 48-bit timestamp, big-endian
-        bytes_data[0] = (timestamp_ms >> 40) & 0xFF
-        bytes_data[1] = (timestamp_ms >> 32) & 0xFF
-        bytes_data[2] = (timestamp_ms >> 24) & 0xFF
-        bytes_data[3] = (timestamp_ms >> 16) & 0xFF
-        bytes_data[4] = (timestamp_ms >> 8) & 0xFF
-        bytes_data[5] = timestamp_ms & 0xFF
-
-        # 80-bit random
-        bytes_data[6:16] = random_bytes
-
-        # Encode 128 bits into 26 base32 chars (with 2-bit prefix = 130 bits total)
-        output = []
-        buffer = 0
-        bits_left = 2  # prefix two 0 bits
+        return cls.encode_int((timestamp_ms << 80) | int.from_bytes(random_bytes, "big"))
 
-        for byte in bytes_data:
-            buffer = (buffer << 8) | byte
-            bits_left += 8
-
-            while bits_left >= 5:
-                shift = bits_left - 5
-                index = (buffer >> shift) & 0x1F
-                output.append(cls.ALPHABET[index])
-                bits_left -= 5
-
-                # Mask out consumed bits
-                buffer = 0 if bits_left == 0 else buffer & (1 << bits_left) - 1
-
-        if len(output) != cls.LENGTH:
-            msg = f"ULID encoding produced {len(output)} chars, expected {cls.LENGTH}"
-            raise ValueError(msg)
+    @classmethod
+    def encode_int(cls, value: int) -> str:
+        """Encode a ULID held as a single 128-bit integer into a ULID string.
 
-        return "".join(output)
+        The value is the 48-bit timestamp shifted left by 80 bits, combined with the 80-bit random
+        component. Any bits above 128 are ignored, so an oversized timestamp wraps the same way it
+        does in encode().
 
-    @staticmethod
-    def _shift_left(bytes_data: bytearray, bits: int) -> None:
-        """Shift a byte array left by the specified number of bits (in-place).
+        Args:
+            value: The 128-bit ULID value.
 
-        Raises:
-            ValueError: If the number of bits is not between 1 and 7.
+        Returns:
+            A 26-character ULID string.
         """
-        if not (0 < bits < 8):
-            msg = f"Shift bits must be between 1 and 7, got {bits}"
-            raise ValueError(msg)
+        value &= _ULID_MASK
 
-        carry = 0
-        for i in range(len(bytes_data) - 1, -1, -1):
-            value = bytes_data[i]
-            shifted = (value << bits) | carry
-            bytes_data[i] = shifted & 0xFF
-            carry = shifted >> 8
+        # Encode 128 bits into 26 base32 chars (with 2-bit prefix = 130 bits total)
+        alphabet = cls.ALPHABET
+        return "".join([alphabet[(value >> shift) & 0x1F] for shift in cls._SHIFTS])
 
 
 class ULIDGenerator:
@@ -227,7 +192,7 @@ class ULIDGenerator:
         """Initialize the generator."""
         self._lock = threading.Lock()
         self._last_timestamp_ms = 0
-        self._last_random = bytearray(10)
+        self._last_random = 0
 
     @classmethod
     def get_shared(cls) -> ULIDGenerator:
@@ -247,21 +212,33 @@ class ULIDGenerator:
         Returns:
             A 26-character ULID string guaranteed to sort after previously generated ULIDs.
         """
-        if date is None:
-            date = datetime.now(UTC)
+        return self.next_ms(None if date is None else int(max(0, date.timestamp()) * 1000))
+
+    def next_ms(self, now_ms: int | None = None) -> str:
+        """Generate the next ULID with monotonic guarantees from a millisecond timestamp.
+
+        This is the same as next(), but skips creating a datetime when the caller already has the
+        time in milliseconds or just wants the current time.
+
+        Args:
+            now_ms: Milliseconds since the Unix epoch. Defaults to current time.
 
-        now_ms = int(max(0, date.timestamp()) * 1000)
+        Returns:
+            A 26-character ULID string guaranteed to sort after previously generated ULIDs.
+        """
+        if now_ms is None:
+            now_ms = time.time_ns() // 1_000_000
 
         with self._lock:
             if now_ms > self._last_timestamp_ms:
                 # Time advanced, use new timestamp and fresh randomness
                 self._last_timestamp_ms = now_ms
-                self._last_random = bytearray(os.urandom(10))
+                self._last_random = int.from_bytes(os.urandom(10), "big")
             else:
                 # Same millisecond or clock skew - increment random component
                 self._increment_random()
 
-            return ULID.encode(self._last_timestamp_ms, bytes(self._last_random))
+            return ULID.encode_int((self._last_timestamp_ms << 80) | self._last_random)
 
     def seed(self, existing_ulid: str) -> None:
         """Seed the generator from an existing ULID.
@@ -276,6 +253,8 @@ class ULIDGenerator:
         if decoded is None:
             return
 
+        random_value = int.from_bytes(decoded.random_bytes, "big")
+
         with self._lock:
             # Only update if the existing ULID is greater than our current state
             should_replace = False
@@ -283,25 +262,20 @@ class ULIDGenerator:
             if decoded.timestamp_ms > self._last_timestamp_ms:
                 should_replace = True
             elif decoded.timestamp_ms == self._last_timestamp_ms:
-                # Same timestamp - compare random bytes lexicographically
-                should_replace = bytes(self._last_random) < decoded.random_bytes
+                # Same timestamp - compare the random components
+                should_replace = self._last_random < random_value
 
             if should_replace:
                 self._last_timestamp_ms = decoded.timestamp_ms
-                self._last_random = bytearray(decoded.random_bytes)
+                self._last_random = random_value
 
     def _increment_random(self) -> None:
-        """Increment the random component as a big-endian 80-bit integer."""
-        # Add 1 to the 10-byte random value (big-endian)
-        for i in range(9, -1, -1):
-            if self._last_random[i] == 0xFF:
-                self._last_random[i] = 0
-                continue
-            self._last_random[i] = (self._last_random[i] + 1) & 0xFF
-            return
+        """Increment the random component as an 80-bit integer."""
+        self._last_random = (self._last_random + 1) & _RANDOM_MASK
 
         # Overflow (extremely unlikely) - reseed with fresh randomness
-        self._last_random = bytearray(os.urandom(10))
+        if not self._last_random:
+            self._last_random = int.from_bytes(os.urandom(10), "big")
 
 
 # Convenience singleton access
@@ -333,4 +307,5 @@ def generate_ulid(date: datetime | None = None) -> str:
     Returns:
         A 26-character ULID string.
     """
-    return get_ulid_generator().next(date)
+    generator = get_ulid_generator()
+    return generator.next_ms() if date is None else generator.next(date)
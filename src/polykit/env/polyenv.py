@@ -78,7 +78,9 @@ class PolyEnv(metaclass=Singleton):
 
         # Check the environment variable for debug mode and set up logging
         self.env_debug = self.validate_bool(os.environ.get("ENV_DEBUG", "0"))
-        self.logger = PolyLog.get_logger(level="DEBUG" if self.env_debug else "INFO")
+        self.logger = PolyLog.get_logger(
+            self.__class__.__name__, level="DEBUG" if self.env_debug else "INFO"
+        )
 
         # Load environment variables from files
         self._load_env_files()
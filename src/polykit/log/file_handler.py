@@ -0,0 +1,139 @@
+"""Queued file logging that keeps disk writes off the logging thread.
+
+File log records are handed to a queue by the logging call and written to disk by a background
+QueueListener, so the code doing the logging never waits on a write or a rollover check.
+"""
+
+from __future__ import annotations
+
+import copy
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from io import TextIOWrapper
+    from logging import Handler, LogRecord
+    from queue import SimpleQueue
+
+
+class TrackedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that keeps track of the file size in memory.
+
+    The standard RotatingFileHandler formats every record twice and seeks to the end of the file to
+    decide whether to roll over. This handler formats each record once and counts the bytes it
+    writes, so the rollover check doesn't need to touch the file at all.
+    """
+
+    def __init__(
+        self, filename: str | Path, *args: Any, flush_each: bool = True, **kwargs: Any
+    ) -> None:
+        self._size = 0
+        self._is_regular_file = True
+        self.flush_each = flush_each
+        super().__init__(filename, *args, **kwargs)
+
+    def _open(self) -> TextIOWrapper:
+        """Open the log file and record its current size."""
+        stream = super()._open()
+        self._size = stream.seek(0, 2)
+        self._is_regular_file = Path(self.baseFilename).is_file()
+        return stream
+
+    def shouldRollover(self, record: LogRecord) -> bool:  # noqa: N802
+        """Determine if writing the record would push the file past its size limit."""
+        return self._would_exceed(self._encoded_length(f"{self.format(record)}{self.terminator}"))
+
+    def emit(self, record: LogRecord) -> None:
+        """Write a record to the file, rolling over first if the file would get too big.
+
+        Raises:
+            RecursionError: If formatting the record recurses too deeply.
+        """
+        try:
+            self._write(f"{self.format(record)}{self.terminator}")
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _write(self, msg: str) -> None:
+        """Write a formatted message to the file and update the tracked size."""
+        length = self._encoded_length(msg)
+        if self._would_exceed(length):
+            self.doRollover()
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.write(msg)
+        self._size += length
+        if self.flush_each:
+            self.flush()
+
+    def _encoded_length(self, msg: str) -> int:
+        """Get the number of bytes a message will take up in the file."""
+        if msg.isascii():
+            return len(msg)
+        return len(msg.encode(self.stream.encoding if self.stream else "utf-8", "replace"))
+
+    def _would_exceed(self, length: int) -> bool:
+        """Check whether writing the given number of bytes would exceed the size limit."""
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        # Never roll over anything other than regular files (see bpo-45401)
+        return self._is_regular_file and self._size + length >= self.maxBytes
+
+
+class MessageQueueHandler(QueueHandler):
+    """Queue handler that passes along the merged message without adding traceback text.
+
+    The default QueueHandler formats the record before queuing it, which adds any exception text to
+    the message. This keeps the message exactly as logged so the file output matches what the file
+    formatter would produce on its own.
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """Merge the message and arguments and strip anything that can't cross the queue."""
+        msg = record.getMessage()
+        record = copy.copy(record)
+        record.message = msg
+        record.msg = msg
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+
+class FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers once the queue has been drained.
+
+    Paired with a handler that doesn't flush after every record, this lets a burst of log calls
+    reach the disk in one write instead of one write per record.
+    """
+
+    def __init__(
+        self,
+        record_queue: SimpleQueue[LogRecord],
+        *handlers: Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(record_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._record_queue = record_queue
+
+    def handle(self, record: LogRecord) -> None:
+        """Handle a record, flushing if there's nothing else waiting in the queue."""
+        super().handle(record)
+        if self._record_queue.empty():
+            self.flush()
+
+    def stop(self) -> None:
+        """Stop the listener and flush whatever it wrote on the way out."""
+        super().stop()
+        self.flush()
+
+    def flush(self) -> None:
+        """Flush all of the listener's handlers."""
+        for handler in self.handlers:
+            handler.flush()
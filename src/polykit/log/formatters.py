@@ -1,35 +1,76 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
 from datetime import datetime
 from logging import Formatter, LogRecord
-from zoneinfo import ZoneInfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from polykit.log.types import LogColors, LogLevel
+from polykit.log.types import LEVEL_COLORS, LogColors, LogLevel
+
+# Bracketed label and color for each level name, so formatting a record takes one lookup
+LEVEL_INFO: dict[str, tuple[str, str]] = {
+    "CRITICAL": ("[CRITICAL]", LEVEL_COLORS[LogLevel.CRITICAL].value),
+    "ERROR": ("[ERROR]", LEVEL_COLORS[LogLevel.ERROR].value),
+    "WARNING": ("[WARN]", LEVEL_COLORS[LogLevel.WARNING].value),
+    "INFO": ("[INFO]", LEVEL_COLORS[LogLevel.INFO].value),
+    "DEBUG": ("[DEBUG]", LEVEL_COLORS[LogLevel.DEBUG].value),
+}
+
+# Fallback for custom levels that aren't in the table
+UNKNOWN_LEVEL_INFO: tuple[str, str] = ("", LogColors.RESET.value)
 
 
-@dataclass
 class CustomFormatter(Formatter):
     """Custom log formatter supporting both basic and advanced formats."""
 
-    simple: bool = False
-    show_context: bool = False
-    color: bool = True
+    __slots__ = ("_tz", "color", "show_context", "simple")
 
-    def __post_init__(self):
+    def __init__(self, simple: bool = False, show_context: bool = False, color: bool = True):
         super().__init__()
+        self.simple = simple
+        self.show_context = show_context
+        self.color = color
+        self._tz = self._get_timezone()
+
+    @staticmethod
+    def _get_timezone() -> ZoneInfo | None:
+        """Resolve the display time zone, falling back to local time if TZ isn't an IANA name."""
+        try:
+            return ZoneInfo(os.getenv("TZ", "America/New_York"))
+        except (ZoneInfoNotFoundError, ValueError):
+            return None
 
     def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:  # noqa
         """Format the time in a log record."""
-        tz = ZoneInfo(os.getenv("TZ", "America/New_York"))
-        ct = datetime.fromtimestamp(record.created, tz=tz)
+        ct = datetime.fromtimestamp(record.created, tz=self._tz)
         return ct.strftime(datefmt) if datefmt else ct.isoformat()
 
     def format(self, record: LogRecord) -> str:
         """Format the log record based on the formatter style."""
+        # Merge the message with its args once and reuse it in whichever layout applies
+        message = record.message = record.getMessage()
+
+        if self.simple:
+            return self._format_simple(record, message)
+        return self._format_full(record, message)
+
+    def _format_simple(self, record: LogRecord, message: str) -> str:
+        """Format a record as just the message, colored by level."""
+        if not self.color:
+            return message
+
+        _, level_color = LEVEL_INFO.get(record.levelname, UNKNOWN_LEVEL_INFO)
+        reset = LogColors.RESET
+
+        # Messages above INFO show in bold
+        bold = "" if record.levelname in {"DEBUG", "INFO"} else LogColors.BOLD
+        return f"{reset}{bold}{level_color}{message}{reset}"
+
+    def _format_full(self, record: LogRecord, message: str) -> str:
+        """Format a record with timestamp, level, and optional context."""
+        level_text, level_color = LEVEL_INFO.get(record.levelname, UNKNOWN_LEVEL_INFO)
+
         if self.color:
-            level_color = LogLevel.get_color(record.levelname)
             reset = LogColors.RESET
             bold = LogColors.BOLD
             gray = LogColors.GRAY
@@ -41,22 +82,10 @@ class CustomFormatter(Formatter):
         # Add the timestamp to the record
         record.asctime = self.formatTime(record, "%I:%M:%S %p")
 
-        if self.simple:  # Messages above INFO show in bold
-            bold = "" if record.levelname in {"DEBUG", "INFO"} else bold
-            return f"{reset}{bold}{level_color}{record.getMessage()}{reset}"
-
         # Format the timestamp
         timestamp = f"{reset}{gray}{record.asctime}{reset} "
 
         # Format the log level text
-        level_texts = {
-            "CRITICAL": "[CRITICAL]",
-            "ERROR": "[ERROR]",
-            "WARNING": "[WARN]",
-            "INFO": "[INFO]",
-            "DEBUG": "[DEBUG]",
-        }
-        level_text = level_texts.get(record.levelname, "")
         log_level = f"{bold}{level_color}{level_text}{reset}"
 
         # Add level color to reset if above INFO
@@ -68,15 +97,25 @@ class CustomFormatter(Formatter):
         function = f"{cyan}{record.funcName}: " if self.show_context else " "
 
         # Format the message and return the formatted message
-        message = f"{level_color}{record.getMessage()}{reset}"
-        return f"{timestamp}{log_level}{class_name}{function}{message}"
+        return f"{timestamp}{log_level}{class_name}{function}{level_color}{message}{reset}"
 
 
-@dataclass
 class FileFormatter(Formatter):
     """Formatter class for file log messages."""
 
+    __slots__ = ("_last_asctime", "_last_second")
+
+    def __init__(self):
+        super().__init__()
+        self._last_second = -1
+        self._last_asctime = ""
+
     def format(self, record: LogRecord) -> str:
         """Format a log record for file output."""
-        record.asctime = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+        # Timestamps only have one-second resolution, so reuse the last one until the second changes
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_asctime = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+            self._last_second = second
+        record.asctime = self._last_asctime
         return f"[{record.asctime}] [{record.levelname}] {record.name}: {record.funcName}: {record.getMessage()}"
@@ -6,14 +6,20 @@ defining console color codes for use in the formatter to colorize messages by lo
 
 from __future__ import annotations
 
+import atexit
 import contextlib
 import functools
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
-from polykit.core.singleton import Singleton
+from polykit.log.file_handler import (
+    FlushingQueueListener,
+    MessageQueueHandler,
+    TrackedRotatingFileHandler,
+)
 from polykit.log.formatters import CustomFormatter, FileFormatter
 from polykit.log.types import LogLevel
 
@@ -25,7 +31,7 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-class PolyLog(metaclass=Singleton):
+class PolyLog:
     """A powerful, colorful logger for Python applications. The logical choice for Python logging.
 
     PolyLog provides easy configuration of Python's standard logging with sensible defaults and
@@ -47,6 +53,9 @@ class PolyLog(metaclass=Singleton):
         time_logger.info("Event occurred at %s", datetime.now())  # Formats datetime nicely
     """
 
+    # Background listeners that write file logs, kept so they can be stopped cleanly at exit
+    _file_listeners: ClassVar[list[FlushingQueueListener]] = []
+
     @classmethod
     def get_logger(
         cls,
@@ -119,53 +128,62 @@ class PolyLog(metaclass=Singleton):
         if logger_name is not None:
             return logger_name
 
-        import inspect
-
-        # Try to get the calling frame
-        frame = inspect.currentframe()
-        if frame is not None:
-            frame = frame.f_back  # get_logger's frame
-            if frame is not None:
-                frame = frame.f_back  # get_logger's caller's frame
-
-        # If we have a valid frame, try to identify it
-        if frame is not None:
-            # Try to get class name first
-            if "self" in frame.f_locals:
-                return frame.f_locals["self"].__class__.__name__
-            if "cls" in frame.f_locals:
-                return frame.f_locals["cls"].__name__
-
-            # Get the module name if we can't get the class name
-            module = inspect.getmodule(frame)
-            if module is not None and hasattr(module, "__name__"):
-                return module.__name__.split(".")[-1]
-
-            # Get the filename if we can't get the module name
-            filename = frame.f_code.co_filename
-            if filename:
-                base_filename = Path(filename).name
-                return Path(base_filename).stem
+        # Get the frame of whoever called get_logger
+        try:
+            frame = sys._getframe(2)  # noqa: SLF001
+        except ValueError:
+            return "unknown"
+
+        # Try to get class name first
+        if "self" in frame.f_locals:
+            return frame.f_locals["self"].__class__.__name__
+        if "cls" in frame.f_locals:
+            return frame.f_locals["cls"].__name__
+
+        # The frame's globals already know which module it belongs to
+        module_name = frame.f_globals.get("__name__")
+        if isinstance(module_name, str):
+            return module_name.rsplit(".", 1)[-1]
+
+        # Get the filename if we can't get the module name
+        if filename := frame.f_code.co_filename:
+            return Path(filename).stem
 
         # If we really can't find our place in the universe
         return "unknown"
 
     @staticmethod
     def _add_file_handler(logger: logging.Logger, log_file: Path) -> None:
-        """Add a file handler to the given logger."""
+        """Add a file handler to the given logger.
+
+        Records are queued by the logging call and written to the file by a background listener,
+        so logging never blocks on disk I/O. The listener is stopped at exit to flush the queue.
+        """
         formatter = FileFormatter()
-        log_dir = Path(log_file).parent
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
 
-        if not log_dir.exists():
-            log_dir.mkdir(parents=True, exist_ok=True)
+        # The file isn't opened (or created) until the first record is actually written
+        file_handler = TrackedRotatingFileHandler(
+            log_file, maxBytes=512 * 1024, delay=True, flush_each=False
+        )
+        file_handler.setFormatter(formatter)
 
-        if not log_file.is_file():
-            log_file.touch()
+        # The listener flushes when it runs out of records, so bursts are written out together
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = FlushingQueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        if not PolyLog._file_listeners:
+            atexit.register(PolyLog._stop_file_listeners)
+        PolyLog._file_listeners.append(listener)
 
-        file_handler = RotatingFileHandler(log_file, maxBytes=512 * 1024)
-        file_handler.setFormatter(formatter)
         logger.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        logger.addHandler(MessageQueueHandler(log_queue))
+
+    @staticmethod
+    def _stop_file_listeners() -> None:
+        """Stop the file log listeners, writing out any records still waiting in their queues."""
+        while PolyLog._file_listeners:
+            PolyLog._file_listeners.pop().stop()
 
     @staticmethod
     def _add_remote_handler(logger: logging.Logger) -> None:
@@ -195,6 +213,19 @@ class PolyLog(metaclass=Singleton):
                 file=sys.stderr,
             )
 
+    @classmethod
+    def disable_process_info(cls) -> None:
+        """Stop recording thread, process, and task details on log records.
+
+        Python fills in these fields on every LogRecord it creates, but no PolyLog formatter uses
+        them. Call this once at startup in log-heavy applications to skip that work. It applies to
+        every logger in the process, so leave it alone if other handlers need those fields.
+        """
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        setattr(logging, "logAsyncioTasks", False)
+
     @classmethod
     def exception(
         cls,
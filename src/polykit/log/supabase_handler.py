@@ -26,15 +26,18 @@ from __future__ import annotations
 import contextlib
 import logging
 import os
-import queue
 import threading
 import uuid
+from collections import deque
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from polykit.core.ulid import ULID, generate_ulid
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
 
 class SupabaseLogHandler(logging.Handler):
     """Logging handler that streams log entries to Supabase.
@@ -45,8 +48,15 @@ class SupabaseLogHandler(logging.Handler):
 
     # Buffer configuration
     BUFFER_FLUSH_THRESHOLD = 10
+    BUFFER_MAX_SIZE = 10_000  # oldest records are dropped past this
+    BATCH_MAX_SIZE = 500  # most records sent in a single push
     FLUSH_INTERVAL = 0.15  # seconds
 
+    # Device and session identifiers, shared by every handler in the process
+    _device_id: ClassVar[str | None] = None
+    _session_id: ClassVar[str | None] = None
+    _ids_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         supabase_url: str,
@@ -81,11 +91,13 @@ class SupabaseLogHandler(logging.Handler):
         self.table_name = table_name
 
         # Device and session identification
-        self.device_id = self._get_device_id()
-        self.session_id = generate_ulid()
+        self.device_id, self.session_id = self._get_shared_ids()
 
         # Buffering
-        self.buffer: queue.Queue[logging.LogRecord] = queue.Queue()
+        self.buffer: deque[logging.LogRecord] = deque(maxlen=self.BUFFER_MAX_SIZE)
+        self._buffer_lock = threading.Lock()
+        self._pending = threading.Event()
+        self._flush_now = threading.Event()
         self._shutdown = threading.Event()
 
         # Background flush thread
@@ -98,41 +110,61 @@ class SupabaseLogHandler(logging.Handler):
         Args:
             record: The log record to emit.
         """
-        with contextlib.suppress(queue.Full):
-            self.buffer.put_nowait(record)
+        with self._buffer_lock:
+            self.buffer.append(record)
+            buffered = len(self.buffer)
+
+        # Wake the flush thread, which sleeps while there's nothing to send
+        if not self._pending.is_set():
+            self._pending.set()
+
+        # Once enough records have piled up, send them without waiting out the flush interval
+        if buffered >= self.BUFFER_FLUSH_THRESHOLD and not self._flush_now.is_set():
+            self._flush_now.set()
 
     def close(self) -> None:
         """Clean shutdown of the handler."""
         self._shutdown.set()
+        self._flush_now.set()
+        self._pending.set()
         self.flush_thread.join(timeout=1.0)
 
         # Flush remaining entries
-        self._flush_buffer()
+        while self.buffer:
+            self._flush_buffer()
 
         super().close()
 
     def _flush_loop(self) -> None:
-        """Background thread that periodically flushes the buffer."""
+        """Background thread that flushes the buffer shortly after records arrive."""
         while not self._shutdown.is_set():
-            self._shutdown.wait(timeout=self.FLUSH_INTERVAL)
-            if self.buffer.qsize() >= self.BUFFER_FLUSH_THRESHOLD or not self.buffer.empty():
-                self._flush_buffer()
+            # Sleep until something is logged, then give the batch a moment to fill up
+            self._pending.wait()
+            self._flush_now.wait(timeout=self.FLUSH_INTERVAL)
+
+            # Clear before draining, so anything logged after this point wakes the next round
+            self._pending.clear()
+            self._flush_now.clear()
+            self._flush_buffer()
 
     def _flush_buffer(self) -> None:
         """Flush buffered log entries to Supabase."""
-        if self.buffer.empty():
-            return
-
-        # Collect all pending entries
-        entries: list[logging.LogRecord] = []
-        while not self.buffer.empty():
-            try:
-                entries.append(self.buffer.get_nowait())
-            except queue.Empty:
-                break
-
-        if not entries:
-            return
+        # Swap in an empty buffer so the pending entries are collected in one go, unless there are
+        # more than fit in one push, in which case take the oldest batch and leave the rest
+        with self._buffer_lock:
+            if not self.buffer:
+                return
+            if len(self.buffer) <= self.BATCH_MAX_SIZE:
+                entries, self.buffer = self.buffer, deque(maxlen=self.BUFFER_MAX_SIZE)
+                more_pending = False
+            else:
+                entries = deque(self.buffer.popleft() for _ in range(self.BATCH_MAX_SIZE))
+                more_pending = True
+
+        # Have the flush thread come straight back for whatever was left behind
+        if more_pending:
+            self._flush_now.set()
+            self._pending.set()
 
         # Build records for Supabase
         records = self._build_records(entries)
@@ -140,7 +172,7 @@ class SupabaseLogHandler(logging.Handler):
         # Push to Supabase (with retry)
         self._push_records(records)
 
-    def _build_records(self, entries: list[logging.LogRecord]) -> list[dict[str, Any]]:
+    def _build_records(self, entries: Collection[logging.LogRecord]) -> list[dict[str, Any]]:
         """Build Supabase records from log entries.
 
         Args:
@@ -151,19 +183,24 @@ class SupabaseLogHandler(logging.Handler):
         """
         records = []
 
-        for entry in entries:
+        # These are the same for every record, so look them up once for the whole batch
+        device_id, session_id, app_id = self.device_id, self.session_id, self.app_id
+
+        # Read the randomness for every ULID in one call rather than one call per record
+        random_pool = os.urandom(10 * len(entries))
+
+        for offset, entry in zip(range(0, len(random_pool), 10), entries, strict=True):
             # Generate ULID from the log entry's timestamp
-            timestamp = datetime.fromtimestamp(entry.created, tz=UTC)
-            ulid = ULID.generate(timestamp)
+            ulid = ULID.encode(int(entry.created * 1000), random_pool[offset : offset + 10])
 
             record: dict[str, Any] = {
                 "id": ulid,
-                "timestamp": timestamp.isoformat(),
+                "timestamp": datetime.fromtimestamp(entry.created, tz=UTC).isoformat(),
                 "level": entry.levelname.lower(),
                 "message": entry.getMessage(),
-                "device_id": self.device_id,
-                "session_id": self.session_id,
-                "app_bundle_id": self.app_id,
+                "device_id": device_id,
+                "session_id": session_id,
+                "app_bundle_id": app_id,
             }
 
             # Optional: Add logger name as group identifier
@@ -183,11 +220,16 @@ class SupabaseLogHandler(logging.Handler):
         if not records:
             return
 
+        from postgrest.types import ReturnMethod
+
         # Retry once on transient network errors
         last_error = None
         for attempt in range(2):
             try:
-                self.client.table(self.table_name).insert(records).execute()
+                # Nothing reads the inserted rows, so don't have the server send them back
+                self.client.table(self.table_name).insert(
+                    records, returning=ReturnMethod.minimal
+                ).execute()
                 return  # Success
             except Exception as error:
                 last_error = error
@@ -217,6 +259,23 @@ class SupabaseLogHandler(logging.Handler):
                 file=sys.stderr,
             )
 
+    @classmethod
+    def _get_shared_ids(cls) -> tuple[str, str]:
+        """Get the device and session IDs, working them out on first use.
+
+        Looking up the device ID can mean reading a file from the home directory, so it's only done
+        once per process. The session ID covers the whole process run, so handlers created for
+        different loggers all report under the same session.
+
+        Returns:
+            A tuple of (device_id, session_id).
+        """
+        with cls._ids_lock:
+            if cls._device_id is None or cls._session_id is None:
+                cls._device_id = cls._get_device_id()
+                cls._session_id = generate_ulid()
+            return cls._device_id, cls._session_id
+
     @staticmethod
     def _get_device_id() -> str:
         """Get a stable device identifier.
@@ -18,13 +18,16 @@ class LogLevel(StrEnum):
         """Convert any level format to a logging level integer."""
         if isinstance(level, int):
             return level
-        if isinstance(level, cls):
-            return LOG_LEVELS[level]
-        return LOG_LEVELS[cls(level.lower())]
+        try:  # Covers enum members and lowercase or uppercase names in one lookup
+            return LEVEL_LOOKUP[level]
+        except KeyError:
+            return LOG_LEVELS[cls(level.lower())]
 
     @classmethod
     def get_color(cls, levelname: str) -> str:
         """Get the color code for a log level name."""
+        if color := LEVEL_NAME_COLORS.get(levelname):
+            return color
         try:
             return LEVEL_COLORS[cls(levelname.lower())].value
         except ValueError:
@@ -39,6 +42,13 @@ LOG_LEVELS: dict[LogLevel, int] = {
     LogLevel.CRITICAL: logging.CRITICAL,
 }
 
+# Logging level for each level name in both lowercase and uppercase form
+LEVEL_LOOKUP: dict[str, int] = {
+    name: value
+    for level, value in LOG_LEVELS.items()
+    for name in (level.value, level.value.upper())
+}
+
 
 class LogColors(StrEnum):
     """Available types of log formatting."""
@@ -70,3 +80,8 @@ LEVEL_COLORS: dict[LogLevel, LogColors] = {
     LogLevel.ERROR: LogColors.RED,
     LogLevel.CRITICAL: LogColors.MAGENTA,
 }
+
+# Color code for each uppercase level name, as found on a LogRecord
+LEVEL_NAME_COLORS: dict[str, str] = {
+    level.value.upper(): color.value for level, color in LEVEL_COLORS.items()
+}
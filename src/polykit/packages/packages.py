@@ -10,7 +10,6 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import requests
 from packaging import version
 
 from polykit.packages.types import PackageSource, VersionInfo
@@ -44,6 +43,8 @@ class VersionChecker:
         Returns:
             The latest version string or None if not found.
         """
+        import requests
+
         try:
             response = requests.get(f"https://pypi.org/pypi/{package}/json", timeout=5)
             if response.status_code == 200:
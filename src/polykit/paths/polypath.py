@@ -48,9 +48,12 @@ Examples:
 
 from __future__ import annotations
 
+import os
 import sys
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import ClassVar
 
 from platformdirs import PlatformDirs
 
@@ -75,6 +78,9 @@ class PolyPath:
         log_path = paths.get_log_path("debug.log")
     """
 
+    # Directories already created by any instance, so repeat lookups skip the filesystem
+    _ensured_dirs: ClassVar[set[Path]] = set()
+
     app_name: str
     app_author: str | None = None
     app_domain_prefix: str | None = None
@@ -100,17 +106,12 @@ class PolyPath:
         else:
             app_path = self.app_name
 
-        # Initialize platform directories and convert to Path objects
+        # Initialize platform directories (each one is resolved once, on first access)
         self._dirs = PlatformDirs(
             appname=app_path,
             appauthor=self.app_author,
             version=self.version,
         )
-        self._data_dir = Path(self._dirs.user_data_dir)
-        self._cache_dir = Path(self._dirs.user_cache_dir)
-        self._config_dir = Path(self._dirs.user_config_dir)
-        self._log_dir = Path(self._dirs.user_log_dir)
-        self._state_dir = Path(self._dirs.user_state_dir)
 
         if self.create_dirs:
             self._ensure_base_dirs()
@@ -124,65 +125,98 @@ class PolyPath:
             self.log_dir,
             self.state_dir,
         ]:
-            dir_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(dir_path.parent)
+
+    def _ensure_dir(self, dir_path: Path) -> None:
+        """Create a directory unless it has already been created during this run."""
+        if dir_path not in self._ensured_dirs:
+            # Directories usually exist already, and one stat is cheaper than a failed mkdir
+            if not dir_path.is_dir():
+                dir_path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(dir_path)
 
     def _join_path(
         self, base_dir: Path, paths: tuple[str | Path, ...], no_create: bool = False
     ) -> Path:
         """Join paths and create parent directory if needed."""
-        path = base_dir.joinpath(*paths)
-        if self.create_dirs and not no_create and (not path.exists() or not path.is_file()):
-            path.parent.mkdir(parents=True, exist_ok=True)
+        if len(paths) == 1 and self._is_plain_name(paths[0]):
+            # A single file or folder name sits directly in the base directory, so that's the parent
+            path = base_dir / paths[0]
+            parent = base_dir
+        else:
+            path = base_dir.joinpath(*paths) if paths else base_dir
+            parent = path.parent
+
+        if self.create_dirs and not no_create:
+            self._ensure_dir(parent)
         return path
 
-    @property
+    @staticmethod
+    def _is_plain_name(part: str | Path) -> bool:
+        """Check if a path component is a single name with no separators or special meaning."""
+        return (
+            isinstance(part, str)
+            and part not in {"", ".", ".."}
+            and "/" not in part
+            and os.sep not in part
+        )
+
+    @cached_property
     def home_dir(self) -> Path:
         return Path.home()
 
-    @property
+    @cached_property
     def documents_dir(self) -> Path:
         return Path(self.home_dir, "Documents")
 
-    @property
+    @cached_property
     def downloads_dir(self) -> Path:
         return Path(self.home_dir, "Downloads")
 
-    @property
+    @cached_property
     def music_dir(self) -> Path:
         return Path(self.home_dir, "Music")
 
-    @property
+    @cached_property
     def pictures_dir(self) -> Path:
         return Path(self.home_dir, "Pictures")
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
-        return self._data_dir
+        return Path(self._dirs.user_data_dir)
 
-    @property
+    @cached_property
     def cache_dir(self) -> Path:
-        return self._cache_dir
+        return Path(self._dirs.user_cache_dir)
 
-    @property
+    @cached_property
     def config_dir(self) -> Path:
-        return self._config_dir
+        return Path(self._dirs.user_config_dir)
 
-    @property
+    @cached_property
+    def home_config_dir(self) -> Path:
+        return self.home_dir / ".config" / self.app_name
+
+    @cached_property
     def log_dir(self) -> Path:
-        return self._log_dir
+        return Path(self._dirs.user_log_dir)
 
-    @property
+    @cached_property
     def state_dir(self) -> Path:
-        return self._state_dir
+        return Path(self._dirs.user_state_dir)
+
+    @cached_property
+    def ssh_dir(self) -> Path:
+        return self.home_dir / ".ssh"
 
-    @property
+    @cached_property
     def onedrive_dir(self) -> Path:
         """Get the platform-specific OneDrive base directory."""
         platform = sys.platform
         if platform == "darwin":
-            return Path(self.home_dir) / "Library/CloudStorage/OneDrive-Personal"
+            return self.home_dir / "Library/CloudStorage/OneDrive-Personal"
         if platform == "win32":
-            return Path(self.home_dir) / "OneDrive"
+            return self.home_dir / "OneDrive"
         msg = "OneDrive not supported on this platform"
         raise NotImplementedError(msg)
 
@@ -268,7 +302,7 @@ class PolyPath:
             no_create: Whether to avoid creating directories that don't exist.
             home_root: If True, use ~/.config instead of platform-specific location.
         """
-        base = Path.home() / ".config" / self.app_name if home_root else self.config_dir
+        base = self.home_config_dir if home_root else self.config_dir
         return self._join_path(base, paths, no_create)
 
     def from_log(self, *paths: str | Path, no_create: bool = False) -> Path:
@@ -295,7 +329,7 @@ class PolyPath:
         Args:
             *paths: Path components to join (e.g. 'subfolder', 'file.txt').
         """
-        return Path(self.home_dir, ".ssh").joinpath(*paths)
+        return self.ssh_dir.joinpath(*paths)
 
     def get_ssh_key(self, key_name: str = "id_ed25519") -> Path:
         """Get a specific SSH key file from the user's .ssh directory.
@@ -303,4 +337,4 @@ class PolyPath:
         Args:
             key_name: The name of the SSH key file (default is 'id_ed25519').
         """
-        return self.from_ssh() / key_name
+        return self.ssh_dir / key_name
@@ -3,6 +3,9 @@ from __future__ import annotations
 import re
 from enum import StrEnum
 
+# Matches any HTML tag, compiled once since cleaning HTML is often done in bulk
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+
 
 class Markup(StrEnum):
     """Text format handling and markup language utilities."""
@@ -86,4 +89,6 @@ class Markup(StrEnum):
         )
 
     def _strip_html(self, text: str) -> str:
-        return text if self != Markup.HTML else re.sub(r"<[^>]*>", "", text)
+        if self != Markup.HTML or "<" not in text:
+            return text
+        return HTML_TAG_PATTERN.sub("", text)
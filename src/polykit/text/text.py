@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-import contextlib
 import re
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from .types import COLOR_MAP, SMART_QUOTES_TABLE, STYLE_MAP, Colors
+from .types import (
+    COLOR_MAP,
+    COLOR_NAMES,
+    SMART_QUOTE_CHARS,
+    SMART_QUOTES_TABLE,
+    STYLE_MAP,
+    Colors,
+)
 
 if TYPE_CHECKING:
     from .types import TextColor, TextStyle
@@ -46,23 +52,19 @@ class Text:
         if not color and not style:
             return text
 
-        result = ""
-
-        if style:  # Add styles
-            for attr in style:
-                if attr in STYLE_MAP:
-                    result += STYLE_MAP[attr]
+        # Collect the escape codes and assemble the string in one go
+        codes = [STYLE_MAP[attr] for attr in style if attr in STYLE_MAP] if style else []
 
         if color:  # Add color
-            if color in COLOR_MAP:
-                result += COLOR_MAP[color]
-            else:  # Try to get from our Colors enum (case-insensitive)
-                with contextlib.suppress(AttributeError, TypeError):
-                    result += getattr(Colors, color.upper(), "")
+            code = COLOR_MAP.get(color)
+            if code is None and isinstance(color, str):
+                # Try to get from our Colors enum (case-insensitive)
+                code = COLOR_NAMES.get(color.upper())
+            if code is not None:
+                codes.append(code)
 
         # Add text and reset
-        result += f"{text}{Colors.RESET}"
-        return result
+        return f"{''.join(codes)}{text}{Colors.RESET}"
 
     @staticmethod
     def print_color(
@@ -209,6 +211,9 @@ class Text:
     @staticmethod
     def straighten_quotes(text: str) -> str:
         """Replace smart quotes with straight quotes."""
+        # Most text has no smart quotes, and translate() builds a new string regardless
+        if text.isascii() or not any(quote in text for quote in SMART_QUOTE_CHARS):
+            return text
         return text.translate(SMART_QUOTES_TABLE)
 
     @staticmethod
@@ -1,10 +1,32 @@
 from __future__ import annotations
 
+import functools
 import re
 from typing import ClassVar
 
 from .text import Text
-from .types import CHAR_WIDTHS
+from .types import ASCII_CHAR_WIDTHS, CHAR_WIDTHS
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Widths of characters seen so far, with -1.0 standing in for "use the default width"
+_WIDTH_CACHE: dict[str, float] = {}
+
+
+def _lookup_char_width(char: str) -> float:
+    """Look up the width of a character, returning -1.0 if it should use the default width."""
+    code = ord(char)
+    if 32 <= code < 127:
+        return ASCII_CHAR_WIDTHS[code - 32]
+    if Text.is_emoji(char):
+        return 2.0
+    return CHAR_WIDTHS.get(char, -1.0)
+
+
+@functools.cache
+def _ascii_width_table(default_width: float) -> tuple[float, ...]:
+    """Build a table of widths for all 128 ASCII codes, using the default for control codes."""
+    return (default_width,) * 32 + ASCII_CHAR_WIDTHS + (default_width,)
 
 
 class Truncate:
@@ -24,6 +46,9 @@ class Truncate:
     # Default width for characters not in the mapping
     DEFAULT_WIDTH: ClassVar[float] = 1.0
 
+    # Longest text whose visual width is cached between calls
+    CACHED_WIDTH_MAX_LENGTH: ClassVar[int] = 128
+
     @staticmethod
     def truncate(
         text: str,
@@ -79,7 +104,8 @@ class Truncate:
             if not from_middle:
                 truncated_text += "..."
 
-        if strip_line_breaks:  # Remove line breaks if specified
+        # Remove line breaks if specified (boundary truncation has already collapsed all whitespace)
+        if strip_line_breaks and strict:
             truncated_text = truncated_text.replace("\n", " ")
 
         return truncated_text
@@ -104,15 +130,13 @@ class Truncate:
             truncated_text = f"{text[:split_index].rstrip()}..."
 
         # Clean up and ensure it doesn't end with punctuation
-        truncated_text = re.sub(r"\s+", " ", truncated_text)
+        truncated_text = WHITESPACE_PATTERN.sub(" ", truncated_text)
         if strip and not from_middle and truncated_text[-1] in ".?!":
             truncated_text = f"{truncated_text[:-1]}..."
 
-        # Ensure there are never more than three dots at the end, and replace with ellipsis
-        while truncated_text.endswith("...."):
-            truncated_text = truncated_text[:-1]
-        if truncated_text.endswith("..."):
-            truncated_text = f"{truncated_text[:-3]}..."
+        # Ensure there are never more than three dots at the end
+        if truncated_text.endswith("...."):
+            truncated_text = f"{truncated_text.rstrip('.')}..."
 
         return truncated_text
 
@@ -149,12 +173,37 @@ class Truncate:
         Returns:
             The estimated visual width as a float.
         """
+        # Short strings like prefixes, suffixes, and ellipses get measured repeatedly, so keep those
+        if len(text) <= cls.CACHED_WIDTH_MAX_LENGTH:
+            return cls._cached_visual_width(text)
+        return cls._measure_visual_width(text)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _cached_visual_width(cls, text: str) -> float:
+        """Measure the visual width of a short string, remembering the result."""
+        return cls._measure_visual_width(text)
+
+    @classmethod
+    def _measure_visual_width(cls, text: str) -> float:
+        """Measure the visual width of text by adding up the width of each character."""
         total_width = 0.0
+
+        # Plain ASCII is by far the common case, so sum it straight from the byte values
+        if text.isascii():
+            widths = _ascii_width_table(cls.DEFAULT_WIDTH)
+            for code in text.encode("ascii"):
+                total_width += widths[code]
+            return total_width
+
+        # Otherwise look each character up in the cache, which saves the emoji range checks
+        cache = _WIDTH_CACHE
+        default_width = cls.DEFAULT_WIDTH
         for char in text:
-            if Text.is_emoji(char):
-                total_width += 2.0
-            else:
-                total_width += CHAR_WIDTHS.get(char, cls.DEFAULT_WIDTH)
+            width = cache.get(char)
+            if width is None:
+                width = cache[char] = _lookup_char_width(char)
+            total_width += width if width >= 0 else default_width
         return total_width
 
     @classmethod
@@ -186,11 +235,17 @@ class Truncate:
         if available_width <= 0:
             return ellipsis[: int(target_width)]
 
-        # Find the truncation point
+        # Find the truncation point, looking up widths inline rather than measuring each character
         current_width = 0.0
+        cache = _WIDTH_CACHE
+        default_width = cls.DEFAULT_WIDTH
 
         for i, char in enumerate(text):
-            char_width = cls.calculate_visual_width(char)
+            char_width = cache.get(char)
+            if char_width is None:
+                char_width = cache[char] = _lookup_char_width(char)
+            if char_width < 0:
+                char_width = default_width
             if current_width + char_width > available_width:
                 truncate_pos = i
                 break
@@ -283,12 +338,13 @@ class Truncate:
         }
 
     @classmethod
-    def normalize_text_for_display(cls, text: str, replace_linebreaks: bool = True) -> str:
+    def normalize_text_for_display(cls, text: str, replace_linebreaks: bool = True) -> str:  # noqa: ARG003
         """Normalize text for single-line display.
 
         Args:
             text: The text to normalize.
-            replace_linebreaks: If True, replace line breaks with spaces.
+            replace_linebreaks: Kept for compatibility. Line breaks count as whitespace, so they
+                                are always replaced with spaces along with any other whitespace.
 
         Returns:
             Normalized text suitable for single-line display.
@@ -296,15 +352,9 @@ class Truncate:
         if not text:
             return text
 
-        if replace_linebreaks:
-            # Replace various line break types with spaces
-            text = re.sub(r"\r\n|\r|\n", " ", text)
-
-        # Normalize multiple whitespace to single spaces
-        text = re.sub(r"\s+", " ", text)
-
-        # Strip leading/trailing whitespace
-        return text.strip()
+        # Splitting on whitespace drops leading and trailing whitespace and treats any run of it,
+        # line breaks included, as one separator, so joining with spaces does all the normalizing
+        return " ".join(text.split())
 
     @classmethod
     def calculate_available_content_width(
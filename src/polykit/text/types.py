@@ -11,6 +11,7 @@ SMART_QUOTES_TABLE = str.maketrans({
     "‘": "'",
     "’": "'",
 })
+SMART_QUOTE_CHARS: tuple[str, ...] = tuple(chr(code) for code in SMART_QUOTES_TABLE)
 
 # Numbers as words
 NUM_WORDS: dict[int, str] = {
@@ -70,6 +71,9 @@ COLOR_MAP: dict[str, Colors] = {
     "white": Colors.WHITE,
 }
 
+# Colors by enum name, for case-insensitive lookups of names that aren't in COLOR_MAP
+COLOR_NAMES: dict[str, Colors] = {color.name: color for color in Colors}
+
 # Color names for termcolor
 TextColor = Literal[
     "black",
@@ -295,3 +299,6 @@ CHAR_WIDTHS: dict[str, float] = {
     "…": 1.2,
     "™": 1.2,
 }
+
+# Widths of the printable ASCII characters, indexed by code point minus 32
+ASCII_CHAR_WIDTHS: tuple[float, ...] = tuple(CHAR_WIDTHS[chr(code)] for code in range(32, 127))
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import warnings
 from datetime import date, datetime, timedelta
-from functools import partial
-from typing import Any, ClassVar
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, ClassVar
 from zoneinfo import ZoneInfo
 
 from tzlocal import get_localzone
 
+from polykit.core.deprecate import deprecated
 from polykit.core.singleton import Singleton
-from polykit.text import Text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Zero-padded minute strings, so clock times don't need a format spec parsed for every call
+_TWO_DIGITS: tuple[str, ...] = tuple(f"{i:02d}" for i in range(60))
 
 
 class Time:
@@ -26,6 +32,28 @@ class Time:
         "Sunday",  # 6
     ]
 
+    # Month names, indexed by month number minus one
+    MONTHS: ClassVar[list[str]] = [
+        "January",
+        "February",
+        "March",
+        "April",
+        "May",
+        "June",
+        "July",
+        "August",
+        "September",
+        "October",
+        "November",
+        "December",
+    ]
+
+    # Names for days relative to today, keyed by the difference in days
+    RELATIVE_DAYS: ClassVar[dict[int, str]] = {-1: "yesterday", 0: "today", 1: "tomorrow"}
+
+    # Day numbers keyed by lowercase day name, for constant-time lookups
+    DAY_NUMBERS: ClassVar[dict[str, int]] = {day.lower(): num for num, day in enumerate(DAYS)}
+
     @staticmethod
     def parse(time_str: str, ref_time: datetime | None = None) -> datetime | None:
         """Parse a time string into a timezone-aware datetime, relative to the reference time.
@@ -102,8 +130,7 @@ class Time:
                     return Time.adjust_for_tomorrow_if_needed(now, hour, minute)
 
         if time_str.isdigit() and len(time_str) == 4:  # Otherwise, try without colon
-            hour = int(time_str[:2])
-            minute = int(time_str[2:])
+            hour, minute = divmod(int(time_str), 100)
             if 0 <= hour < 24 and 0 <= minute < 60:
                 return Time.adjust_for_tomorrow_if_needed(now, hour, minute)
 
@@ -137,21 +164,20 @@ class Time:
     @staticmethod
     def format_duration(hours: int = 0, minutes: int = 0, seconds: int = 0) -> str:
         """Print a formatted time duration."""
-        sec_str = Text.plural("second", seconds, show_num=True)
-        min_str = Text.plural("minute", minutes, show_num=True)
-        hour_str = Text.plural("hour", hours, show_num=True)
-
-        if hours == 0:
-            if minutes == 0 and seconds == 0:
-                return sec_str
-            if seconds == 0:
-                return min_str
-            return sec_str if minutes == 0 else f"{min_str} and {sec_str}"
-        if minutes == 0:
-            return hour_str if seconds == 0 else f"{hour_str} and {sec_str}"
-        if seconds == 0:
-            return f"{hour_str} and {min_str}"
-        return f"{hour_str}, {min_str} and {sec_str}"
+        # The unit words are fixed, so pick singular or plural directly
+        parts: list[str] = []
+        if hours:
+            parts.append(f"{hours:,} {'hour' if hours == 1 else 'hours'}")
+        if minutes:
+            parts.append(f"{minutes:,} {'minute' if minutes == 1 else 'minutes'}")
+        if seconds:
+            parts.append(f"{seconds:,} {'second' if seconds == 1 else 'seconds'}")
+
+        if not parts:
+            return "0 seconds"
+        if len(parts) <= 2:
+            return " and ".join(parts)
+        return f"{', '.join(parts[:-1])} and {parts[-1]}"
 
     @staticmethod
     def get_pretty_time(time: datetime | date | timedelta, **kwargs: Any) -> str:
@@ -166,12 +192,30 @@ class Time:
                 - weekday: If True, the weekday will be included in the date format.
                 - compact: If True, use a more compact format for dates within 7 days.
         """
+        return Time._pretty_time(time, None, **kwargs)
+
+    @staticmethod
+    def get_pretty_times(times: Iterable[datetime | date | timedelta], **kwargs: Any) -> list[str]:
+        """Given several timestamps, return a pretty string representation of each one.
+
+        Works like get_pretty_time, but looks up the current date once for the whole batch.
+
+        Args:
+            times: The timestamps to convert (datetime, date, or timedelta).
+            **kwargs: Additional keyword arguments to pass to the formatting function, as with
+                get_pretty_time.
+        """
+        today = datetime.now(tz=TZ).date()
+        return [Time._pretty_time(time, today, **kwargs) for time in times]
+
+    @staticmethod
+    def _pretty_time(time: datetime | date | timedelta, today: date | None, **kwargs: Any) -> str:
         if isinstance(time, datetime):
-            return Time._format_datetime(time, **kwargs)
+            return Time._format_datetime(time, today, **kwargs)
         if isinstance(time, date):
             # Convert date to datetime at midnight for consistent processing
             dt = datetime.combine(time, datetime.min.time().replace(tzinfo=TZ))
-            return Time._format_datetime(dt, date_only=True, **kwargs)
+            return Time._format_datetime(dt, today, date_only=True, **kwargs)
         return Time._format_timedelta(time)
 
     @staticmethod
@@ -186,48 +230,56 @@ class Time:
     @staticmethod
     def _format_datetime(
         time: datetime,
+        today: date | None = None,
         capitalize: bool = False,
         time_only: bool = False,
         date_only: bool = False,
         weekday: bool = False,
         compact: bool = False,
     ) -> str:
-        now = datetime.now(tz=TZ)
-
+        # Build the strings from the fields directly rather than parsing strftime formats
         if time_only:
-            return time.strftime("%-I:%M %p")
+            return Time.convert_to_12h(time.hour, time.minute)
+        clock = "" if date_only else Time.convert_to_12h(time.hour, time.minute)
 
-        days_difference = (time.date() - now.date()).days
+        if today is None:
+            today = datetime.now(tz=TZ).date()
+        days_difference = time.toordinal() - today.toordinal()
 
-        if days_difference == 0:
-            result = "today" if date_only else f"today at {time.strftime('%-I:%M %p')}"
-        elif days_difference == -1:
-            result = "yesterday" if date_only else f"yesterday at {time.strftime('%-I:%M %p')}"
-        elif days_difference == 1:
-            result = "tomorrow" if date_only else f"tomorrow at {time.strftime('%-I:%M %p')}"
+        if relative_day := Time.RELATIVE_DAYS.get(days_difference):
+            result = relative_day if date_only else f"{relative_day} at {clock}"
         elif compact and 1 < abs(days_difference) <= 7:
-            result = time.strftime("%A") if date_only else time.strftime("%A at %-I:%M %p")
+            day_name = Time.DAYS[time.weekday()]
+            result = day_name if date_only else f"{day_name} at {clock}"
         else:
-            result = time.strftime("%A, %B %d") if weekday or compact else time.strftime("%B %d")
+            result = f"{Time.MONTHS[time.month - 1]} {time.day:02d}"
+            if weekday or compact:
+                result = f"{Time.DAYS[time.weekday()]}, {result}"
             if abs(days_difference) > 365:
-                result += time.strftime(", %Y")
+                result += f", {time.year}"
             if not date_only:
-                result += f" at {time.strftime('%-I:%M %p')}"
+                result += f" at {clock}"
 
         return result.capitalize() if capitalize else result
 
     @staticmethod
     def _format_timedelta(time: timedelta) -> str:
-        total_seconds = int(time.total_seconds())
+        # Work from the integer fields rather than converting through float seconds
+        total_seconds = time.days * 86400 + time.seconds
+        if total_seconds < 0 and time.microseconds:
+            total_seconds += 1  # Truncate toward zero like int(total_seconds()) does
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         seconds = total_seconds % 60
         return f"{hours}h {minutes}m {seconds}s"
 
     @staticmethod
+    @lru_cache(maxsize=2048, typed=True)
     def convert_to_12h(hour: int, minutes: int = 0) -> str:
         """Convert 24-hour time to 12-hour time format with AM/PM, including minutes.
 
+        There are only 1,440 valid times in a day, so results are cached.
+
         Args:
             hour: The hour in 24-hour format.
             minutes: The minutes.
@@ -239,7 +291,7 @@ class Time:
             hour = 12
 
         # Ensure minutes are always two digits
-        minutes_formatted = f"{minutes:02d}"
+        minutes_formatted = _TWO_DIGITS[minutes] if 0 <= minutes < 60 else f"{minutes:02d}"
 
         return f"{hour}:{minutes_formatted} {period}"
 
@@ -248,11 +300,11 @@ class Time:
         """Convert a time interval in minutes to a human-readable interval string."""
         hours, minutes = divmod(interval, 60)
 
-        parts = []
+        parts: list[str] = []
         if hours:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+            parts.append(Time._format_unit(hours, "hour"))
         if minutes or not parts:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+            parts.append(Time._format_unit(minutes, "minute"))
 
         return " and ".join(parts)
 
@@ -271,22 +323,27 @@ class Time:
         hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
 
-        parts = []
+        parts: list[str] = []
         if days:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
+            parts.append(Time._format_unit(days, "day", omit_one))
         if hours:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+            parts.append(Time._format_unit(hours, "hour", omit_one))
         if minutes:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+            parts.append(Time._format_unit(minutes, "minute", omit_one))
         if seconds or not parts:
-            parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-
-        if omit_one:
-            parts = [p.replace("1 ", "") if p.startswith("1 ") else p for p in parts]
+            parts.append(Time._format_unit(seconds, "second", omit_one))
 
         return " and ".join(parts)
 
     @staticmethod
+    def _format_unit(count: int, unit: str, omit_one: bool = False) -> str:
+        """Format a count with its unit, pluralized as needed, or just the unit if omitting one."""
+        if count == 1:
+            return unit if omit_one else f"1 {unit}"
+        return f"{count} {unit}s"
+
+    @staticmethod
+    @deprecated("Add a timedelta to the datetime directly instead.")
     def add_time_to_datetime(
         original_datetime: datetime,
         hours: int = 0,
@@ -319,8 +376,16 @@ class Time:
 
     @staticmethod
     def get_day_number(day: str) -> int:
-        """Convert day name to day number (0-6, where Monday is 0)."""
-        return Time.DAYS.index(day)
+        """Convert day name to day number (0-6, where Monday is 0). Case-insensitive.
+
+        Raises:
+            ValueError: If the day name isn't recognized.
+        """
+        try:
+            return Time.DAY_NUMBERS[day.lower()]
+        except KeyError:
+            msg = f"{day!r} is not a valid day name"
+            raise ValueError(msg) from None
 
 
 class TimeZoneManager(metaclass=Singleton):